@@ -3,7 +3,7 @@
 from abc import ABC, abstractmethod
 from typing import Any
 
-from rubric.types import Criterion, EvaluationReport
+from rubric.types import Criterion, CriterionReport, EvaluationReport
 
 
 class Autograder(ABC):
@@ -66,3 +66,51 @@ class Autograder(ABC):
         """
         judge_results = await self.judge(to_grade, rubric, query)
         return await self.aggregate(judge_results, normalize=self.normalize)
+
+
+def score_criterion_reports(
+    judge_results: list[CriterionReport], *, normalize: bool = True
+) -> EvaluationReport:
+    """Compute the weighted score for per-criterion verdicts in a single pass.
+
+    Shared by the graders that return a CriterionReport per criterion. MET verdicts contribute
+    their weight (negative weights subtract), UNMET verdicts contribute nothing.
+
+    Args:
+        judge_results: One CriterionReport per rubric criterion.
+        normalize: If True, normalize score to 0-1. If False, return raw weighted sum.
+    """
+    total_positive_weight = 0.0
+    total_negative_weight = 0.0
+    weighted_score_sum = 0.0
+    for report in judge_results:
+        weight = report.weight
+        if weight > 0:
+            total_positive_weight += weight
+        elif weight < 0:
+            total_negative_weight -= weight
+        if report.verdict == "MET":
+            weighted_score_sum += weight
+
+    raw_score = weighted_score_sum
+
+    if normalize:
+        if total_positive_weight > 0:
+            score = max(0.0, min(1.0, weighted_score_sum / total_positive_weight))
+        elif total_negative_weight > 0:
+            # All-negative rubric: score starts at 1.0, errors (MET) subtract from it
+            # weighted_score_sum is <= 0 for all-negative rubrics
+            # Formula: 1.0 + (negative_sum / total_negative)
+            # gives 1.0 when no errors, 0.0 when all errors
+            score = max(0.0, min(1.0, 1.0 + weighted_score_sum / total_negative_weight))
+        else:
+            score = 0.0
+    else:
+        score = raw_score
+
+    return EvaluationReport(
+        score=score,
+        raw_score=raw_score,
+        llm_raw_score=raw_score,  # Same as raw_score for per-criterion graders
+        report=judge_results,
+    )
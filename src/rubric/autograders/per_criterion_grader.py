@@ -1,8 +1,14 @@
 """Per Criterion grader evaluates each criterion separately in parallel LLM calls."""
 
 import asyncio
+import hashlib
+import weakref
+from collections.abc import MutableMapping
+from contextlib import AbstractAsyncContextManager, nullcontext
+from typing import Any
 
 from rubric.autograders import Autograder
+from rubric.autograders.base import score_criterion_reports
 from rubric.autograders.schemas import PerCriterionOutput
 from rubric.types import (
     Criterion,
@@ -120,6 +126,16 @@ entails no China location without mentioning China.""
 Return only raw JSON starting with {, no back-ticks, no 'json' prefix."""
 
 
+class _SharedCall:
+    """A generate_fn call shared by every concurrent caller with the same cache key."""
+
+    __slots__ = ("future", "waiters")
+
+    def __init__(self, future: asyncio.Future[PerCriterionOutput]):
+        self.future = future
+        self.waiters = 0
+
+
 class PerCriterionGrader(Autograder):
     """Concrete autograder that evaluates each criterion independently.
 
@@ -128,6 +144,16 @@ class PerCriterionGrader(Autograder):
             Users handle parsing, validation, and retries in their implementation.
         system_prompt: System prompt for criterion evaluation.
         normalize: If True (default), normalize scores to 0-1.
+        max_concurrency: Maximum number of generate_fn calls this grader keeps in flight at
+            once, shared across concurrent grade() calls (e.g. from Rubric.grade_many). None
+            (default) issues one call per criterion at once. Set this to stay under provider
+            rate limits.
+        cache: Optional mapping used to memoize generate_fn results, keyed by a hash of the
+            system and user prompts. Any MutableMapping works, e.g. a dict or a
+            diskcache.Cache for persistence. Concurrent identical prompts share a single call.
+            Use a separate cache per model/generate_fn.
+        skip_empty_submissions: If True, empty or whitespace-only submissions are marked UNMET
+            for every criterion without calling generate_fn. Defaults to False.
     """
 
     def __init__(
@@ -136,34 +162,116 @@ class PerCriterionGrader(Autograder):
         *,
         system_prompt: str = DEFAULT_SYSTEM_PROMPT,
         normalize: bool = True,
+        max_concurrency: int | None = None,
+        cache: MutableMapping[str, PerCriterionOutput] | None = None,
+        skip_empty_submissions: bool = False,
     ):
         super().__init__(normalize=normalize)
+        if max_concurrency is not None and max_concurrency < 1:
+            raise ValueError(f"max_concurrency must be at least 1, got {max_concurrency}")
         self.generate_fn = generate_fn
         self.system_prompt = system_prompt
+        self.max_concurrency = max_concurrency
+        self.cache = cache
+        self.skip_empty_submissions = skip_empty_submissions
+        # Semaphores are bound to one event loop, so the limiter is rebuilt whenever the grader
+        # is used from a new loop. The loop is held weakly so closed loops can be collected.
+        self._limiter: asyncio.Semaphore | None = None
+        self._limiter_loop: weakref.ref[asyncio.AbstractEventLoop] | None = None
+        # Cache misses currently being generated, so concurrent duplicates share one call.
+        self._in_flight: dict[str, _SharedCall] = {}
+
+    def _get_limiter(self) -> AbstractAsyncContextManager[Any]:
+        if self.max_concurrency is None:
+            return nullcontext()
+        loop = asyncio.get_running_loop()
+        if self._limiter is None or self._limiter_loop is None or self._limiter_loop() is not loop:
+            self._limiter = asyncio.Semaphore(self.max_concurrency)
+            self._limiter_loop = weakref.ref(loop)
+        return self._limiter
+
+    async def _generate(
+        self, user_prompt: str, limiter: AbstractAsyncContextManager[Any]
+    ) -> PerCriterionOutput:
+        # Call generate_fn - user handles validation and retries
+        async with limiter:
+            return await self.generate_fn(system_prompt=self.system_prompt, user_prompt=user_prompt)
+
+    async def _generate_and_cache(
+        self,
+        user_prompt: str,
+        cache: MutableMapping[str, PerCriterionOutput],
+        cache_key: str,
+        limiter: AbstractAsyncContextManager[Any],
+    ) -> PerCriterionOutput:
+        result = await self._generate(user_prompt, limiter)
+        cache[cache_key] = result
+        return result
+
+    async def _generate_shared(
+        self,
+        user_prompt: str,
+        cache: MutableMapping[str, PerCriterionOutput],
+        cache_key: str,
+        limiter: AbstractAsyncContextManager[Any],
+    ) -> PerCriterionOutput:
+        shared = self._in_flight.get(cache_key)
+        if shared is None:
+            shared = _SharedCall(
+                asyncio.ensure_future(
+                    self._generate_and_cache(user_prompt, cache, cache_key, limiter)
+                )
+            )
+            self._in_flight[cache_key] = shared
+            shared.future.add_done_callback(lambda _: self._discard_shared_call(cache_key, shared))
+
+        shared.waiters += 1
+        try:
+            # Shielded so cancelling one waiter doesn't cancel the call for the others.
+            return await asyncio.shield(shared.future)
+        finally:
+            shared.waiters -= 1
+            if shared.waiters == 0 and not shared.future.done():
+                # The last waiter was cancelled, so nobody needs the result any more.
+                self._discard_shared_call(cache_key, shared)
+                shared.future.cancel()
+
+    def _discard_shared_call(self, cache_key: str, shared: _SharedCall) -> None:
+        if self._in_flight.get(cache_key) is shared:
+            del self._in_flight[cache_key]
+        if shared.future.done() and not shared.future.cancelled():
+            # Every waiter may be gone; retrieve the error so asyncio doesn't log it as unhandled.
+            shared.future.exception()
 
     async def _judge_single_criterion(
-        self, criterion: Criterion, to_grade: str, query: str | None = None
+        self,
+        criterion: Criterion,
+        submission_text: str,
+        limiter: AbstractAsyncContextManager[Any],
     ) -> CriterionReport:
         criterion_type = "negative" if criterion.weight < 0 else "positive"
-        query_text = f"<query>{query}</query>" if query else ""
-        user_prompt = f"""<criterion_type>
+        # The shared submission block comes first so every criterion's prompt starts with the
+        # same bytes, which lets provider-side prefix caching reuse it across calls.
+        user_prompt = f"""{submission_text}
+
+<criterion_type>
 {criterion_type}
 </criterion_type>
 
 <criterion>
 {criterion.requirement}
-</criterion>
-
-{query_text}
-
-<response>
-{to_grade}
-</response>"""
+</criterion>"""
 
-        # Call generate_fn - user handles validation and retries
-        result: PerCriterionOutput = await self.generate_fn(
-            system_prompt=self.system_prompt, user_prompt=user_prompt
-        )
+        cache = self.cache
+        if cache is None:
+            result = await self._generate(user_prompt, limiter)
+        else:
+            cache_key = hashlib.blake2b(
+                f"{self.system_prompt}\0{user_prompt}".encode(), digest_size=32
+            ).hexdigest()
+            result = cache.get(cache_key)
+            if result is None:
+                result = await self._generate_shared(user_prompt, cache, cache_key, limiter)
 
         return CriterionReport(
             requirement=criterion.requirement,
@@ -175,41 +283,32 @@ class PerCriterionGrader(Autograder):
     async def judge(
         self, to_grade: str, rubric: list[Criterion], query: str | None = None
     ) -> list[CriterionReport]:
+        if self.skip_empty_submissions and not to_grade.strip():
+            # Nothing can be present in an empty response, so every criterion is UNMET.
+            return [
+                CriterionReport(
+                    requirement=criterion.requirement,
+                    verdict="UNMET",
+                    reason="Submission is empty",
+                    weight=criterion.weight,
+                )
+                for criterion in rubric
+            ]
+
+        # The query/response block is identical for every criterion, so render it once.
+        query_text = f"<query>{query}</query>\n\n" if query else ""
+        submission_text = f"""{query_text}<response>
+{to_grade}
+</response>"""
+
+        limiter = self._get_limiter()
         criterion_tasks = [
-            self._judge_single_criterion(criterion, to_grade, query) for criterion in rubric
+            self._judge_single_criterion(criterion, submission_text, limiter)
+            for criterion in rubric
         ]
         return list(await asyncio.gather(*criterion_tasks))
 
     async def aggregate(
         self, judge_results: list[CriterionReport], *, normalize: bool = True
     ) -> EvaluationReport:
-        total_positive_weight = sum(max(0.0, report.weight) for report in judge_results)
-        total_negative_weight = sum(
-            abs(report.weight) for report in judge_results if report.weight < 0
-        )
-        weighted_score_sum = sum(
-            (1.0 if report.verdict == "MET" else 0.0) * report.weight for report in judge_results
-        )
-
-        raw_score = weighted_score_sum
-
-        if normalize:
-            if total_positive_weight > 0:
-                score = max(0.0, min(1.0, weighted_score_sum / total_positive_weight))
-            elif total_negative_weight > 0:
-                # All-negative rubric: score starts at 1.0, errors (MET) subtract from it
-                # weighted_score_sum is <= 0 for all-negative rubrics
-                # Formula: 1.0 + (negative_sum / total_negative)
-                # gives 1.0 when no errors, 0.0 when all errors
-                score = max(0.0, min(1.0, 1.0 + weighted_score_sum / total_negative_weight))
-            else:
-                score = 0.0
-        else:
-            score = raw_score
-
-        return EvaluationReport(
-            score=score,
-            raw_score=raw_score,
-            llm_raw_score=raw_score,  # Same as raw_score for per-criterion graders
-            report=judge_results,
-        )
+        return score_criterion_reports(judge_results, normalize=normalize)
@@ -2,7 +2,10 @@
 
 from __future__ import annotations
 
+import asyncio
+
 from rubric.autograders import Autograder
+from rubric.autograders.base import score_criterion_reports
 from rubric.autograders.schemas import OneShotOutput
 from rubric.types import (
     Criterion,
@@ -95,6 +98,9 @@ class PerCriterionOneShotGrader(Autograder):
             Users handle parsing, validation, and retries in their implementation.
         system_prompt: System prompt for one-shot evaluation.
         normalize: If True (default), normalize scores to 0-1.
+        batch_size: Maximum number of criteria per LLM call. Rubrics with more criteria are
+            split into batches that are evaluated concurrently. None (default) evaluates the
+            whole rubric in one call.
     """
 
     def __init__(
@@ -103,13 +109,32 @@ class PerCriterionOneShotGrader(Autograder):
         *,
         system_prompt: str = DEFAULT_SYSTEM_PROMPT,
         normalize: bool = True,
+        batch_size: int | None = None,
     ):
         super().__init__(normalize=normalize)
+        if batch_size is not None and batch_size < 1:
+            raise ValueError(f"batch_size must be at least 1, got {batch_size}")
         self.generate_fn = generate_fn
         self.system_prompt = system_prompt
+        self.batch_size = batch_size
 
     async def judge(
         self, to_grade: str, rubric: list[Criterion], query: str | None = None
+    ) -> list[CriterionReport]:
+        if self.batch_size is None or len(rubric) <= self.batch_size:
+            return await self._judge_batch(to_grade, rubric, query)
+
+        batches = [
+            rubric[start : start + self.batch_size]
+            for start in range(0, len(rubric), self.batch_size)
+        ]
+        batch_reports = await asyncio.gather(
+            *(self._judge_batch(to_grade, batch, query) for batch in batches)
+        )
+        return [report for reports in batch_reports for report in reports]
+
+    async def _judge_batch(
+        self, to_grade: str, rubric: list[Criterion], query: str | None = None
     ) -> list[CriterionReport]:
         criteria_lines = []
         for index, criterion in enumerate(rubric, start=1):
@@ -176,33 +201,4 @@ Provide your evaluation as JSON only."""
     async def aggregate(
         self, judge_results: list[CriterionReport], *, normalize: bool = True
     ) -> EvaluationReport:
-        total_positive_weight = sum(max(0.0, report.weight) for report in judge_results)
-        total_negative_weight = sum(
-            abs(report.weight) for report in judge_results if report.weight < 0
-        )
-        weighted_score_sum = sum(
-            (1.0 if report.verdict == "MET" else 0.0) * report.weight for report in judge_results
-        )
-
-        raw_score = weighted_score_sum
-
-        if normalize:
-            if total_positive_weight > 0:
-                score = max(0.0, min(1.0, weighted_score_sum / total_positive_weight))
-            elif total_negative_weight > 0:
-                # All-negative rubric: score starts at 1.0, errors (MET) subtract from it
-                # weighted_score_sum is <= 0 for all-negative rubrics
-                # Formula: 1.0 + (negative_sum / total_negative)
-                # gives 1.0 when no errors, 0.0 when all errors
-                score = max(0.0, min(1.0, 1.0 + weighted_score_sum / total_negative_weight))
-            else:
-                score = 0.0
-        else:
-            score = raw_score
-
-        return EvaluationReport(
-            score=score,
-            raw_score=raw_score,
-            llm_raw_score=raw_score,  # Same as raw_score for per-criterion graders
-            report=judge_results,
-        )
+        return score_criterion_reports(judge_results, normalize=normalize)
@@ -7,7 +7,7 @@ decoding in their LLM clients.
 
 from typing import Literal
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 
 class PerCriterionOutput(BaseModel):
@@ -22,6 +22,8 @@ class PerCriterionOutput(BaseModel):
         ... )
     """
 
+    model_config = ConfigDict(frozen=True)
+
     criterion_status: Literal["MET", "UNMET"] = Field(
         description="Whether the criterion is present (MET) or absent (UNMET) in the response."
     )
@@ -34,12 +36,28 @@ class CriterionEvaluation(BaseModel):
     Used by OneShotOutput to represent each criterion's verdict.
     """
 
+    model_config = ConfigDict(frozen=True)
+
     criterion_number: int = Field(description="The 1-based index of the criterion being evaluated.")
     criterion_status: Literal["MET", "UNMET"] = Field(
         description="Whether the criterion is present (MET) or absent (UNMET) in the response."
     )
     explanation: str = Field(description="Brief explanation of the verdict.")
 
+    @classmethod
+    def met(cls, criterion_number: int, explanation: str) -> "CriterionEvaluation":
+        """Build a MET evaluation."""
+        return cls(
+            criterion_number=criterion_number, criterion_status="MET", explanation=explanation
+        )
+
+    @classmethod
+    def unmet(cls, criterion_number: int, explanation: str) -> "CriterionEvaluation":
+        """Build an UNMET evaluation."""
+        return cls(
+            criterion_number=criterion_number, criterion_status="UNMET", explanation=explanation
+        )
+
 
 class OneShotOutput(BaseModel):
     """Expected output for PerCriterionOneShotGrader.
@@ -53,6 +71,8 @@ class OneShotOutput(BaseModel):
         ... ])
     """
 
+    model_config = ConfigDict(frozen=True)
+
     criteria_evaluations: list[CriterionEvaluation] = Field(
         description="List of evaluations for each criterion.", min_length=1
     )
@@ -67,6 +87,8 @@ class RubricAsJudgeOutput(BaseModel):
         >>> output = RubricAsJudgeOutput(overall_score=85.0, explanation="...")
     """
 
+    model_config = ConfigDict(frozen=True)
+
     overall_score: float = Field(
         description="Holistic score from 0-100 representing overall rubric satisfaction.",
     )
@@ -1,5 +1,6 @@
 """Core Rubric class for evaluating text outputs against a set of weighted criteria."""
 
+import asyncio
 import json
 from pathlib import Path
 from typing import Any
@@ -7,9 +8,9 @@ from typing import Any
 import yaml
 from pydantic import ValidationError
 
-from rubric.autograders import Autograder, PerCriterionGrader
+from rubric.autograders import Autograder, PerCriterionOneShotGrader
 from rubric.types import Criterion, EvaluationReport
-from rubric.utils import default_per_criterion_generate_fn
+from rubric.utils import default_oneshot_generate_fn
 
 
 class Rubric:
@@ -33,15 +34,59 @@ class Rubric:
 
         Args:
             to_grade: The text to evaluate.
-            autograder: Optional autograder to use. Defaults to PerCriterionGrader.
-                Configure normalize on the autograder if needed.
+            autograder: Optional autograder to use. Defaults to PerCriterionOneShotGrader,
+                which evaluates every criterion in a single LLM call. Configure normalize
+                on the autograder if needed.
             query: Optional input/query that prompted the response.
             **kwargs: Additional arguments (unused).
         """
         if autograder is None:
-            autograder = PerCriterionGrader(generate_fn=default_per_criterion_generate_fn)
+            autograder = PerCriterionOneShotGrader(generate_fn=default_oneshot_generate_fn)
         return await autograder.grade(to_grade=to_grade, rubric=self.rubric, query=query)
 
+    async def grade_many(
+        self,
+        submissions: list[str],
+        autograder: Autograder | None = None,
+        queries: list[str | None] | None = None,
+        max_concurrency: int = 48,
+    ) -> list[EvaluationReport]:
+        """Grade many submissions against this rubric concurrently.
+
+        Args:
+            submissions: The texts to evaluate.
+            autograder: Optional autograder shared by every submission. Defaults to
+                PerCriterionOneShotGrader.
+            queries: Optional per-submission queries, aligned with submissions.
+            max_concurrency: Maximum number of submissions graded at the same time.
+
+        Returns:
+            One EvaluationReport per submission, in the same order as submissions.
+        """
+        if max_concurrency < 1:
+            raise ValueError(f"max_concurrency must be at least 1, got {max_concurrency}")
+        if queries is not None and len(queries) != len(submissions):
+            raise ValueError(
+                f"Expected {len(submissions)} queries to match submissions, got {len(queries)}"
+            )
+        if autograder is None:
+            autograder = PerCriterionOneShotGrader(generate_fn=default_oneshot_generate_fn)
+
+        semaphore = asyncio.Semaphore(max_concurrency)
+
+        async def _grade_one(to_grade: str, query: str | None) -> EvaluationReport:
+            async with semaphore:
+                return await self.grade(to_grade, autograder=autograder, query=query)
+
+        return list(
+            await asyncio.gather(
+                *(
+                    _grade_one(to_grade, queries[index] if queries is not None else None)
+                    for index, to_grade in enumerate(submissions)
+                )
+            )
+        )
+
     @staticmethod
     def validate_and_create_criteria(
         data: list[dict[str, Any]] | dict[str, Any],
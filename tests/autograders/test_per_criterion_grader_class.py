@@ -1,19 +1,59 @@
+import asyncio
+import gc
 import re
+import weakref
 
 import pytest
+from pydantic import ValidationError
 
 from rubric import Criterion, PerCriterionOutput, Rubric
 from rubric.autograders import PerCriterionGrader
 from rubric.types import EvaluationReport
 
+_CRITERION_RE = re.compile(r"<criterion>(.*?)</criterion>", re.DOTALL)
+_CRITERION_TYPE_RE = re.compile(r"<criterion_type>(.*?)</criterion_type>", re.DOTALL)
+
+
+def _criterion_text(user_prompt: str) -> str:
+    match = _CRITERION_RE.search(user_prompt)
+    assert match is not None
+    return match.group(1).strip()
+
+
+class _InFlightTracker:
+    """Mock generate_fn that records the peak number of concurrent calls."""
+
+    def __init__(self) -> None:
+        self.in_flight = 0
+        self.peak_in_flight = 0
+
+    async def generate(self, system_prompt: str, user_prompt: str) -> PerCriterionOutput:
+        self.in_flight += 1
+        self.peak_in_flight = max(self.peak_in_flight, self.in_flight)
+        await asyncio.sleep(0.01)
+        self.in_flight -= 1
+        return PerCriterionOutput(criterion_status="MET", explanation="Requirement met")
+
+
+def test_per_criterion_output_is_hashable():
+    """Frozen outputs can be shared between calls and used as cache keys."""
+    output = PerCriterionOutput(criterion_status="MET", explanation="Requirement satisfied.")
+    same_output = PerCriterionOutput(criterion_status="MET", explanation="Requirement satisfied.")
+
+    assert hash(output) == hash(same_output)
+    assert output == same_output
+    assert len({output, same_output}) == 1
+    with pytest.raises(ValidationError):
+        output.criterion_status = "UNMET"  # type: ignore
+
 
 @pytest.mark.asyncio
 async def test_per_criterion_grader_class_integration(
-    sample_rubric, sample_output, per_criterion_generate_fn
+    sample_rubric, sample_output, per_criterion_grader
 ):
-    grader = PerCriterionGrader(generate_fn=per_criterion_generate_fn)
-
-    report: EvaluationReport = await sample_rubric.grade(sample_output, autograder=grader)
+    report: EvaluationReport = await sample_rubric.grade(
+        sample_output, autograder=per_criterion_grader
+    )
 
     print(report.report)
 
@@ -31,9 +71,7 @@ async def test_per_criterion_grader_class_integration(
 @pytest.mark.asyncio
 async def test_per_criterion_grader_with_negative_criterion_unmet(sample_rubric):
     async def generate_with_issue(system_prompt: str, user_prompt: str) -> PerCriterionOutput:
-        criterion_type_match = re.search(
-            r"<criterion_type>(.*?)</criterion_type>", user_prompt, re.DOTALL
-        )
+        criterion_type_match = _CRITERION_TYPE_RE.search(user_prompt)
         criterion_type = (
             criterion_type_match.group(1).strip().lower() if criterion_type_match else "positive"
         )
@@ -55,21 +93,14 @@ async def test_per_criterion_grader_with_negative_criterion_unmet(sample_rubric)
 
 
 @pytest.mark.asyncio
-async def test_all_negative_criteria_all_unmet_returns_perfect_score():
+async def test_all_negative_criteria_all_unmet_returns_perfect_score(all_negative_rubric):
     """All-negative rubric with no errors present should return 1.0."""
-    rubric = Rubric(
-        [
-            Criterion(weight=-1.0, requirement="Contains factual errors"),
-            Criterion(weight=-1.0, requirement="Contains profanity"),
-            Criterion(weight=-1.0, requirement="Contains harmful content"),
-        ]
-    )
 
     async def generate_no_errors(system_prompt: str, user_prompt: str) -> PerCriterionOutput:
         return PerCriterionOutput(criterion_status="UNMET", explanation="Error not present")
 
     grader = PerCriterionGrader(generate_fn=generate_no_errors)
-    result = await rubric.grade("Clean, accurate text", autograder=grader)
+    result = await all_negative_rubric.grade("Clean, accurate text", autograder=grader)
 
     assert result.score == pytest.approx(1.0)
     assert result.raw_score == pytest.approx(0.0)
@@ -77,21 +108,14 @@ async def test_all_negative_criteria_all_unmet_returns_perfect_score():
 
 
 @pytest.mark.asyncio
-async def test_all_negative_criteria_all_met_returns_zero_score():
+async def test_all_negative_criteria_all_met_returns_zero_score(all_negative_rubric):
     """All-negative rubric with all errors present should return 0.0."""
-    rubric = Rubric(
-        [
-            Criterion(weight=-1.0, requirement="Contains factual errors"),
-            Criterion(weight=-1.0, requirement="Contains profanity"),
-            Criterion(weight=-1.0, requirement="Contains harmful content"),
-        ]
-    )
 
     async def generate_all_errors(system_prompt: str, user_prompt: str) -> PerCriterionOutput:
         return PerCriterionOutput(criterion_status="MET", explanation="Error is present")
 
     grader = PerCriterionGrader(generate_fn=generate_all_errors)
-    result = await rubric.grade("Bad text with errors", autograder=grader)
+    result = await all_negative_rubric.grade("Bad text with errors", autograder=grader)
 
     assert result.score == pytest.approx(0.0)
     assert result.raw_score == pytest.approx(-3.0)
@@ -99,28 +123,17 @@ async def test_all_negative_criteria_all_met_returns_zero_score():
 
 
 @pytest.mark.asyncio
-async def test_all_negative_criteria_partial_errors_returns_partial_score():
+async def test_all_negative_criteria_partial_errors_returns_partial_score(all_negative_rubric):
     """All-negative rubric with some errors should return partial score."""
-    rubric = Rubric(
-        [
-            Criterion(weight=-1.0, requirement="Contains factual errors"),
-            Criterion(weight=-1.0, requirement="Contains profanity"),
-            Criterion(weight=-1.0, requirement="Contains harmful content"),
-        ]
-    )
-
-    call_count = 0
 
     async def generate_one_error(system_prompt: str, user_prompt: str) -> PerCriterionOutput:
-        nonlocal call_count
-        call_count += 1
         # First criterion has error, others don't
-        if call_count == 1:
+        if _criterion_text(user_prompt) == "Contains factual errors":
             return PerCriterionOutput(criterion_status="MET", explanation="Error is present")
         return PerCriterionOutput(criterion_status="UNMET", explanation="Error not present")
 
     grader = PerCriterionGrader(generate_fn=generate_one_error)
-    result = await rubric.grade("Text with one error", autograder=grader)
+    result = await all_negative_rubric.grade("Text with one error", autograder=grader)
 
     # 1 error out of 3: score = 1.0 + (-1.0 / 3.0) = 2/3 ≈ 0.667
     assert result.score == pytest.approx(2.0 / 3.0)
@@ -137,13 +150,9 @@ async def test_all_negative_criteria_with_different_weights():
         ]
     )
 
-    call_count = 0
-
     async def generate_minor_error_only(system_prompt: str, user_prompt: str) -> PerCriterionOutput:
-        nonlocal call_count
-        call_count += 1
         # Only the minor error (second criterion) is present
-        if call_count == 2:
+        if _criterion_text(user_prompt) == "Contains minor typos":
             return PerCriterionOutput(criterion_status="MET", explanation="Minor error present")
         return PerCriterionOutput(criterion_status="UNMET", explanation="Error not present")
 
@@ -154,3 +163,158 @@ async def test_all_negative_criteria_with_different_weights():
     # score = 1.0 + (-1.0 / 3.0) = 2/3 ≈ 0.667
     assert result.score == pytest.approx(2.0 / 3.0)
     assert result.raw_score == pytest.approx(-1.0)
+
+
+@pytest.mark.asyncio
+async def test_max_concurrency_limits_in_flight_generate_calls(sample_rubric):
+    """max_concurrency caps how many generate_fn calls run at the same time."""
+    tracker = _InFlightTracker()
+    grader = PerCriterionGrader(generate_fn=tracker.generate, max_concurrency=2)
+    result = await sample_rubric.grade("Test", autograder=grader)
+
+    assert tracker.peak_in_flight == 2
+    assert len(result.report) == len(sample_rubric.rubric)
+
+
+@pytest.mark.asyncio
+async def test_max_concurrency_is_shared_across_grade_many_submissions(sample_rubric):
+    """A grader's max_concurrency caps in-flight calls across concurrent grade() calls too."""
+    tracker = _InFlightTracker()
+    grader = PerCriterionGrader(generate_fn=tracker.generate, max_concurrency=2)
+    reports = await sample_rubric.grade_many(
+        [f"Submission {i}" for i in range(10)], autograder=grader
+    )
+
+    assert tracker.peak_in_flight == 2
+    assert len(reports) == 10
+
+
+def test_max_concurrency_does_not_retain_closed_event_loops(sample_rubric):
+    """A long-lived grader driven by repeated asyncio.run() calls must not keep old loops alive."""
+    tracker = _InFlightTracker()
+    grader = PerCriterionGrader(generate_fn=tracker.generate, max_concurrency=1)
+    loop_refs: list[weakref.ref[asyncio.AbstractEventLoop]] = []
+
+    async def grade_once() -> None:
+        loop_refs.append(weakref.ref(asyncio.get_running_loop()))
+        await sample_rubric.grade("Test", autograder=grader)
+
+    for _ in range(5):
+        asyncio.run(grade_once())
+    gc.collect()
+
+    # Only the limiter from the most recent loop may still be alive.
+    assert all(ref() is None for ref in loop_refs[:-1])
+    assert tracker.peak_in_flight == 1
+
+
+def test_max_concurrency_must_be_positive(per_criterion_generate_fn):
+    with pytest.raises(ValueError, match="max_concurrency must be at least 1"):
+        PerCriterionGrader(generate_fn=per_criterion_generate_fn, max_concurrency=0)
+
+
+@pytest.mark.asyncio
+async def test_per_criterion_prompts_share_submission_prefix(sample_rubric):
+    """Per-criterion prompts start with the same bytes so provider prefix caches can hit."""
+    prompts: list[tuple[str, str]] = []
+
+    async def record_prompts(system_prompt: str, user_prompt: str) -> PerCriterionOutput:
+        prompts.append((system_prompt, user_prompt))
+        return PerCriterionOutput(criterion_status="MET", explanation="Requirement met")
+
+    grader = PerCriterionGrader(generate_fn=record_prompts)
+    await sample_rubric.grade("Paris is in France.", autograder=grader, query="Where is Paris?")
+
+    submission_prefix = (
+        "<query>Where is Paris?</query>\n\n<response>\nParis is in France.\n</response>"
+    )
+    assert len(prompts) == len(sample_rubric.rubric)
+    assert len({system_prompt for system_prompt, _ in prompts}) == 1
+    for (_, user_prompt), criterion in zip(prompts, sample_rubric.rubric):
+        assert user_prompt.startswith(submission_prefix)
+        assert user_prompt.endswith(f"<criterion>\n{criterion.requirement}\n</criterion>")
+
+
+@pytest.mark.asyncio
+async def test_cache_skips_generate_fn_for_repeated_submissions(sample_rubric):
+    calls = 0
+
+    async def counting_generate_fn(system_prompt: str, user_prompt: str) -> PerCriterionOutput:
+        nonlocal calls
+        calls += 1
+        return PerCriterionOutput(criterion_status="MET", explanation="Requirement met")
+
+    cache: dict[str, PerCriterionOutput] = {}
+    grader = PerCriterionGrader(generate_fn=counting_generate_fn, cache=cache)
+
+    first = await sample_rubric.grade("Test", autograder=grader)
+    assert calls == len(sample_rubric.rubric)
+    assert len(cache) == len(sample_rubric.rubric)
+
+    second = await sample_rubric.grade("Test", autograder=grader)
+    assert calls == len(sample_rubric.rubric)
+    assert second == first
+
+    await sample_rubric.grade("Different submission", autograder=grader)
+    assert calls == 2 * len(sample_rubric.rubric)
+
+
+@pytest.mark.asyncio
+async def test_cache_shares_in_flight_calls_for_concurrent_duplicates(sample_rubric):
+    calls = 0
+
+    async def counting_generate_fn(system_prompt: str, user_prompt: str) -> PerCriterionOutput:
+        nonlocal calls
+        calls += 1
+        await asyncio.sleep(0.01)
+        return PerCriterionOutput(criterion_status="MET", explanation="Requirement met")
+
+    grader = PerCriterionGrader(generate_fn=counting_generate_fn, cache={})
+    reports = await sample_rubric.grade_many(["Same"] * 5, autograder=grader)
+
+    assert calls == len(sample_rubric.rubric)
+    assert all(report == reports[0] for report in reports)
+
+
+@pytest.mark.asyncio
+async def test_cancelling_only_waiter_cancels_cached_generate_call():
+    started = asyncio.Event()
+    cancelled = asyncio.Event()
+
+    async def hanging_generate_fn(system_prompt: str, user_prompt: str) -> PerCriterionOutput:
+        started.set()
+        try:
+            await asyncio.sleep(10)
+        except asyncio.CancelledError:
+            cancelled.set()
+            raise
+        return PerCriterionOutput(criterion_status="MET", explanation="Requirement met")
+
+    rubric = Rubric([Criterion(weight=1.0, requirement="Is correct")])
+    grader = PerCriterionGrader(generate_fn=hanging_generate_fn, cache={})
+
+    with pytest.raises(asyncio.TimeoutError):
+        await asyncio.wait_for(rubric.grade("Test", autograder=grader), timeout=0.05)
+
+    assert started.is_set()
+    await asyncio.wait_for(cancelled.wait(), timeout=1)
+
+
+@pytest.mark.asyncio
+async def test_skip_empty_submissions_does_not_call_generate_fn(all_negative_rubric):
+    calls = 0
+
+    async def counting_generate_fn(system_prompt: str, user_prompt: str) -> PerCriterionOutput:
+        nonlocal calls
+        calls += 1
+        return PerCriterionOutput(criterion_status="MET", explanation="Error is present")
+
+    grader = PerCriterionGrader(generate_fn=counting_generate_fn, skip_empty_submissions=True)
+    result = await all_negative_rubric.grade("   \n", autograder=grader)
+
+    assert calls == 0
+    assert result.score == pytest.approx(1.0)
+    assert all(r.verdict == "UNMET" for r in result.report)
+
+    await all_negative_rubric.grade("Some text", autograder=grader)
+    assert calls == len(all_negative_rubric.rubric)
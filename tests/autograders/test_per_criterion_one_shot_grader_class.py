@@ -1,9 +1,24 @@
+import re
+
 import pytest
 
 from rubric import Criterion, CriterionEvaluation, OneShotOutput, Rubric
 from rubric.autograders import PerCriterionOneShotGrader
 
 
+def test_criterion_evaluation_constructors_match_validated_model():
+    assert CriterionEvaluation.met(1, "Satisfied") == CriterionEvaluation(
+        criterion_number=1, criterion_status="MET", explanation="Satisfied"
+    )
+    assert CriterionEvaluation.unmet(2, "Missing") == CriterionEvaluation(
+        criterion_number=2, criterion_status="UNMET", explanation="Missing"
+    )
+    # Parsed LLM output may carry the criterion number as a string; validation coerces it.
+    assert CriterionEvaluation.model_validate(
+        {"criterion_number": "3", "criterion_status": "MET", "explanation": "Parsed"}
+    ) == CriterionEvaluation.met(3, "Parsed")
+
+
 @pytest.mark.asyncio
 async def test_per_criterion_one_shot_grader_class_integration(
     sample_rubric, sample_output, one_shot_generate_fn
@@ -28,14 +43,10 @@ async def test_per_criterion_one_shot_grader_with_negative_criterion_unmet(sampl
     async def generate_with_issue(system_prompt: str, user_prompt: str) -> OneShotOutput:
         return OneShotOutput(
             criteria_evaluations=[
-                CriterionEvaluation(criterion_number=1, criterion_status="MET", explanation="Test"),
-                CriterionEvaluation(criterion_number=2, criterion_status="MET", explanation="Test"),
-                CriterionEvaluation(criterion_number=3, criterion_status="MET", explanation="Test"),
-                CriterionEvaluation(
-                    criterion_number=4,
-                    criterion_status="UNMET",
-                    explanation="Error not present",
-                ),
+                CriterionEvaluation.met(1, "Test"),
+                CriterionEvaluation.met(2, "Test"),
+                CriterionEvaluation.met(3, "Test"),
+                CriterionEvaluation.unmet(4, "Error not present"),
             ]
         )
 
@@ -50,39 +61,20 @@ async def test_per_criterion_one_shot_grader_with_negative_criterion_unmet(sampl
 
 
 @pytest.mark.asyncio
-async def test_all_negative_criteria_all_unmet_returns_perfect_score():
+async def test_all_negative_criteria_all_unmet_returns_perfect_score(all_negative_rubric):
     """All-negative rubric with no errors present should return 1.0."""
-    rubric = Rubric(
-        [
-            Criterion(weight=-1.0, requirement="Contains factual errors"),
-            Criterion(weight=-1.0, requirement="Contains profanity"),
-            Criterion(weight=-1.0, requirement="Contains harmful content"),
-        ]
-    )
 
     async def generate_no_errors(system_prompt: str, user_prompt: str) -> OneShotOutput:
         return OneShotOutput(
             criteria_evaluations=[
-                CriterionEvaluation(
-                    criterion_number=1,
-                    criterion_status="UNMET",
-                    explanation="No errors",
-                ),
-                CriterionEvaluation(
-                    criterion_number=2,
-                    criterion_status="UNMET",
-                    explanation="No profanity",
-                ),
-                CriterionEvaluation(
-                    criterion_number=3,
-                    criterion_status="UNMET",
-                    explanation="No harmful content",
-                ),
+                CriterionEvaluation.unmet(1, "No errors"),
+                CriterionEvaluation.unmet(2, "No profanity"),
+                CriterionEvaluation.unmet(3, "No harmful content"),
             ]
         )
 
     grader = PerCriterionOneShotGrader(generate_fn=generate_no_errors)
-    result = await rubric.grade("Clean, accurate text", autograder=grader)
+    result = await all_negative_rubric.grade("Clean, accurate text", autograder=grader)
 
     assert result.score == pytest.approx(1.0)
     assert result.raw_score == pytest.approx(0.0)
@@ -102,14 +94,8 @@ async def test_all_negative_criteria_all_met_returns_zero_score():
     async def generate_all_errors(system_prompt: str, user_prompt: str) -> OneShotOutput:
         return OneShotOutput(
             criteria_evaluations=[
-                CriterionEvaluation(
-                    criterion_number=1, criterion_status="MET", explanation="Has errors"
-                ),
-                CriterionEvaluation(
-                    criterion_number=2,
-                    criterion_status="MET",
-                    explanation="Has profanity",
-                ),
+                CriterionEvaluation.met(1, "Has errors"),
+                CriterionEvaluation.met(2, "Has profanity"),
             ]
         )
 
@@ -119,3 +105,32 @@ async def test_all_negative_criteria_all_met_returns_zero_score():
     assert result.score == pytest.approx(0.0)
     assert result.raw_score == pytest.approx(-2.0)
     assert all(r.verdict == "MET" for r in result.report)
+
+
+@pytest.mark.asyncio
+async def test_batch_size_splits_rubric_into_concurrent_calls():
+    """Each batch is numbered from 1 and reports come back in rubric order."""
+    rubric = Rubric([Criterion(weight=1.0, requirement=f"Requirement {i}") for i in range(5)])
+    criterion_line = re.compile(r"^(\d+)\. .*(Requirement \d+)$", re.MULTILINE)
+    batches: list[list[str]] = []
+
+    async def generate_per_batch(system_prompt: str, user_prompt: str) -> OneShotOutput:
+        lines = criterion_line.findall(user_prompt)
+        batches.append([requirement for _, requirement in lines])
+        return OneShotOutput(
+            criteria_evaluations=[
+                CriterionEvaluation.met(int(number), requirement) for number, requirement in lines
+            ]
+        )
+
+    grader = PerCriterionOneShotGrader(generate_fn=generate_per_batch, batch_size=2)
+    result = await rubric.grade("Test", autograder=grader)
+
+    assert sorted(len(batch) for batch in batches) == [1, 2, 2]
+    assert [r.reason for r in result.report] == [c.requirement for c in rubric.rubric]
+    assert result.score == pytest.approx(1.0)
+
+
+def test_batch_size_must_be_positive(one_shot_generate_fn):
+    with pytest.raises(ValueError, match="batch_size must be at least 1"):
+        PerCriterionOneShotGrader(generate_fn=one_shot_generate_fn, batch_size=0)
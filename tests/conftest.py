@@ -1,3 +1,4 @@
+import asyncio
 import re
 from collections.abc import Awaitable, Callable
 
@@ -11,6 +12,7 @@ from rubric import (
     Rubric,
     RubricAsJudgeOutput,
 )
+from rubric.autograders import PerCriterionGrader
 from rubric.autograders.schemas import CriterionEvaluation
 
 CriterionList = list[Criterion]
@@ -21,12 +23,25 @@ RubricAsJudgeGenerateFn = Callable[[str, str], Awaitable[RubricAsJudgeOutput]]
 load_dotenv()
 
 
-@pytest.fixture
+try:
+    import uvloop  # type: ignore
+except ImportError:
+    pass
+else:
+    # Mocked generate functions never touch the network, so event loop overhead dominates
+    # test time. Use uvloop when it is installed (it is not available on Windows); otherwise
+    # pytest-asyncio's default event_loop_policy fixture applies.
+    @pytest.fixture(scope="session")
+    def event_loop_policy() -> asyncio.AbstractEventLoopPolicy:
+        return uvloop.EventLoopPolicy()
+
+
+@pytest.fixture(scope="session")
 def sample_output() -> str:
     return "Paris is the capital of France. It is a beautiful city with rich history."
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_criteria() -> CriterionList:
     return [
         Criterion(
@@ -48,11 +63,37 @@ def sample_criteria() -> CriterionList:
     ]
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_rubric(sample_criteria: CriterionList) -> Rubric:
     return Rubric(sample_criteria)
 
 
+@pytest.fixture(scope="session")
+def all_negative_rubric() -> Rubric:
+    return Rubric(
+        [
+            Criterion(weight=-1.0, requirement="Contains factual errors"),
+            Criterion(weight=-1.0, requirement="Contains profanity"),
+            Criterion(weight=-1.0, requirement="Contains harmful content"),
+        ]
+    )
+
+
+# Output schemas are frozen, so the mock judge can hand out shared instances.
+_ERROR_PRESENT = PerCriterionOutput(
+    criterion_status="MET", explanation="Error detected in the output."
+)
+_ERROR_ABSENT = PerCriterionOutput(
+    criterion_status="UNMET", explanation="Error not present in the output."
+)
+_REQUIREMENT_MET = PerCriterionOutput(
+    criterion_status="MET", explanation="Requirement satisfied by the submission."
+)
+_REQUIREMENT_UNMET = PerCriterionOutput(
+    criterion_status="UNMET", explanation="Requirement not satisfied by the submission."
+)
+
+
 def _extract_field(pattern: re.Pattern[str], text: str) -> str:
     match = pattern.search(text)
     if not match:
@@ -60,7 +101,7 @@ def _extract_field(pattern: re.Pattern[str], text: str) -> str:
     return match.group(1).strip()
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def per_criterion_generate_fn() -> PerCriterionGenerateFn:
     criterion_pattern = re.compile(r"<criterion>(.*?)</criterion>", re.DOTALL)
     type_pattern = re.compile(r"<criterion_type>(.*?)</criterion_type>", re.DOTALL)
@@ -81,30 +122,19 @@ def per_criterion_generate_fn() -> PerCriterionGenerateFn:
             # For negative criteria: criterion_status="MET" means error IS present (bad)
             # criterion_status="UNMET" means error is NOT present (good)
             error_present = negative_errors_present.get(criterion_text, False)
-            explanation = (
-                "Error detected in the output."
-                if error_present
-                else "Error not present in the output."
-            )
-            return PerCriterionOutput(
-                criterion_status="MET" if error_present else "UNMET",
-                explanation=explanation,
-            )
+            return _ERROR_PRESENT if error_present else _ERROR_ABSENT
 
         criteria_met = criterion_text in positive_requirements_met
-        explanation = (
-            "Requirement satisfied by the submission."
-            if criteria_met
-            else "Requirement not satisfied by the submission."
-        )
-        return PerCriterionOutput(
-            criterion_status="MET" if criteria_met else "UNMET",
-            explanation=explanation,
-        )
+        return _REQUIREMENT_MET if criteria_met else _REQUIREMENT_UNMET
 
     return _generate
 
 
+@pytest.fixture(scope="session")
+def per_criterion_grader(per_criterion_generate_fn: PerCriterionGenerateFn) -> PerCriterionGrader:
+    return PerCriterionGrader(generate_fn=per_criterion_generate_fn)
+
+
 @pytest.fixture
 def one_shot_generate_fn(sample_criteria: CriterionList) -> OneShotGenerateFn:
     async def _generate(system_prompt: str, user_prompt: str) -> OneShotOutput:
@@ -112,18 +142,13 @@ def one_shot_generate_fn(sample_criteria: CriterionList) -> OneShotGenerateFn:
         for index, criterion in enumerate(sample_criteria, start=1):
             if criterion.weight < 0:
                 # For negative criteria: UNMET means error is NOT present (good)
-                criterion_status = "UNMET"
-                explanation = "Error not present in the submission."
+                evaluations.append(
+                    CriterionEvaluation.unmet(index, "Error not present in the submission.")
+                )
             else:
-                criterion_status = "MET"
-                explanation = "Requirement satisfied by the submission."
-            evaluations.append(
-                CriterionEvaluation(
-                    criterion_number=index,
-                    criterion_status=criterion_status,
-                    explanation=explanation,
+                evaluations.append(
+                    CriterionEvaluation.met(index, "Requirement satisfied by the submission.")
                 )
-            )
 
         return OneShotOutput(criteria_evaluations=evaluations)
 
@@ -1,7 +1,11 @@
+import asyncio
+import time
+
 import pytest
 
-from rubric import Criterion, Rubric
-from rubric.autograders import PerCriterionGrader
+import rubric.rubric as rubric_module
+from rubric import Criterion, CriterionEvaluation, OneShotOutput, PerCriterionOutput, Rubric
+from rubric.autograders import PerCriterionGrader, PerCriterionOneShotGrader
 
 MOCK_DATASET = [
     {
@@ -21,79 +25,173 @@ MOCK_DATASET = [
     },
 ]
 
+FORMATTING_CRITERIA = [
+    Criterion(
+        weight=1.0,
+        requirement="Output uses proper capitalization and punctuation",
+    ),
+    Criterion(
+        weight=1.0,
+        requirement="Output is concise and avoids unnecessary verbosity",
+    ),
+]
+
+CORRECTNESS_CRITERIA_TEMPLATES = (
+    (2.0, "Output correctly answers the question: '{input}'"),
+    (1.0, "Output includes the expected information: '{expected}'"),
+)
+
+VALID_VERDICTS = frozenset({"MET", "UNMET"})
+
 
 @pytest.mark.asyncio
-async def test_rubric(per_criterion_generate_fn):
-    formatting_criteria = [
-        Criterion(
-            weight=1.0,
-            requirement="Output uses proper capitalization and punctuation",
+async def test_rubric(per_criterion_grader):
+    formatting_rubric = Rubric(FORMATTING_CRITERIA)
+    autograder = per_criterion_grader
+
+    correctness_rubrics = [
+        Rubric(
+            [
+                Criterion(weight=weight, requirement=template.format(**dataset_item))
+                for weight, template in CORRECTNESS_CRITERIA_TEMPLATES
+            ]
+        )
+        for dataset_item in MOCK_DATASET
+    ]
+
+    # Grade every item against both rubrics concurrently instead of awaiting each in turn.
+    reports = await asyncio.gather(
+        *(
+            correctness_rubric.grade(dataset_item["output"], autograder=autograder)
+            for correctness_rubric, dataset_item in zip(correctness_rubrics, MOCK_DATASET)
         ),
-        Criterion(
-            weight=1.0,
-            requirement="Output is concise and avoids unnecessary verbosity",
+        *(
+            formatting_rubric.grade(dataset_item["output"], autograder=autograder)
+            for dataset_item in MOCK_DATASET
         ),
-    ]
+    )
+    correctness_reports = reports[: len(MOCK_DATASET)]
+    formatting_reports = reports[len(MOCK_DATASET) :]
 
-    formatting_rubric = Rubric(formatting_criteria)
-
-    autograder = PerCriterionGrader(generate_fn=per_criterion_generate_fn)
-
-    for idx, dataset_item in enumerate(MOCK_DATASET):
-        correctness_criteria = [
-            Criterion(
-                weight=2.0,
-                requirement=f"Output correctly answers the question: '{dataset_item['input']}'",
-            ),
-            Criterion(
-                weight=1.0,
-                requirement=(
-                    f"Output includes the expected information: '{dataset_item['expected']}'"
-                ),
-            ),
-        ]
-
-        correctness_rubric = Rubric(correctness_criteria)
-
-        correctness_report = await correctness_rubric.grade(
-            dataset_item["output"],
-            autograder=autograder,
-        )
+    for correctness_rubric, correctness_report, formatting_report in zip(
+        correctness_rubrics, correctness_reports, formatting_reports
+    ):
+        assert correctness_report is not None
+        assert formatting_report is not None
 
-        formatting_report = await formatting_rubric.grade(
-            dataset_item["output"],
-            autograder=autograder,
-        )
+        assert 0 <= correctness_report.score <= 100
+        assert 0 <= formatting_report.score <= 100
 
-        assert correctness_report is not None, f"Item {idx + 1}: Correctness report is None"
-        assert formatting_report is not None, f"Item {idx + 1}: Formatting report is None"
+        assert correctness_report.report is not None
+        assert formatting_report.report is not None
 
-        assert 0 <= correctness_report.score <= 100, (
-            f"Item {idx + 1}: Correctness score {correctness_report.score} out of range"
-        )
-        assert 0 <= formatting_report.score <= 100, (
-            f"Item {idx + 1}: Formatting score {formatting_report.score} out of range"
-        )
+        assert len(correctness_report.report) == len(correctness_rubric.rubric)
+        assert len(formatting_report.report) == len(FORMATTING_CRITERIA)
 
-        assert correctness_report.report is not None, f"Item {idx + 1}: Correctness report is None"
-        assert formatting_report.report is not None, f"Item {idx + 1}: Formatting report is None"
+        assert {criterion.verdict for criterion in correctness_report.report} <= VALID_VERDICTS
+        assert all(criterion.reason for criterion in correctness_report.report)
 
-        assert len(correctness_report.report) == len(correctness_criteria), (
-            f"Item {idx + 1}: Wrong number of correctness criteria"
-        )
+        assert {criterion.verdict for criterion in formatting_report.report} <= VALID_VERDICTS
+        assert all(criterion.reason for criterion in formatting_report.report)
 
-        assert len(formatting_report.report) == len(formatting_criteria), (
-            f"Item {idx + 1}: Wrong number of formatting criteria"
-        )
 
-        for criterion in correctness_report.report:
-            assert criterion.verdict in ["MET", "UNMET"], (
-                f"Item {idx + 1}: Invalid correctness verdict {criterion.verdict}"
-            )
-            assert criterion.reason, f"Item {idx + 1}: Missing reason for correctness criterion"
-
-        for criterion in formatting_report.report:
-            assert criterion.verdict in ["MET", "UNMET"], (
-                f"Item {idx + 1}: Invalid formatting verdict {criterion.verdict}"
-            )
-            assert criterion.reason, f"Item {idx + 1}: Missing reason for formatting criterion"
+@pytest.mark.asyncio
+async def test_grade_fans_out_criteria_concurrently():
+    """Per-criterion judge calls must all start together rather than one after another."""
+    rubric = Rubric([Criterion(weight=1.0, requirement=f"Requirement {i}") for i in range(5)])
+    entry_times: list[float] = []
+
+    async def slow_generate_fn(system_prompt: str, user_prompt: str) -> PerCriterionOutput:
+        entry_times.append(time.monotonic())
+        await asyncio.sleep(0.1)
+        return PerCriterionOutput(criterion_status="MET", explanation="Requirement met")
+
+    report = await rubric.grade("Test", autograder=PerCriterionGrader(generate_fn=slow_generate_fn))
+
+    assert len(entry_times) == 5
+    assert max(entry_times) - min(entry_times) < 0.05
+    assert report.score == pytest.approx(1.0)
+
+
+@pytest.mark.asyncio
+async def test_grade_defaults_to_one_shot_grader(monkeypatch, sample_rubric, one_shot_generate_fn):
+    calls = 0
+
+    async def counting_generate_fn(system_prompt: str, user_prompt: str):
+        nonlocal calls
+        calls += 1
+        return await one_shot_generate_fn(system_prompt, user_prompt)
+
+    monkeypatch.setattr(rubric_module, "default_oneshot_generate_fn", counting_generate_fn)
+
+    report = await sample_rubric.grade("Paris is the capital of France.")
+
+    assert calls == 1
+    assert report.score == pytest.approx(1.0)
+    assert len(report.report) == len(sample_rubric.rubric)
+
+
+@pytest.mark.asyncio
+async def test_grade_many_bounds_concurrency(sample_rubric, one_shot_generate_fn):
+    in_flight = 0
+    peak_in_flight = 0
+
+    async def slow_generate_fn(system_prompt: str, user_prompt: str) -> OneShotOutput:
+        nonlocal in_flight, peak_in_flight
+        in_flight += 1
+        peak_in_flight = max(peak_in_flight, in_flight)
+        await asyncio.sleep(0.01)
+        in_flight -= 1
+        return await one_shot_generate_fn(system_prompt, user_prompt)
+
+    grader = PerCriterionOneShotGrader(generate_fn=slow_generate_fn)
+    reports = await sample_rubric.grade_many(
+        [f"Submission {i}" for i in range(20)], autograder=grader, max_concurrency=5
+    )
+
+    assert len(reports) == 20
+    assert peak_in_flight == 5
+    assert all(report.score == pytest.approx(1.0) for report in reports)
+
+
+@pytest.mark.asyncio
+async def test_grade_many_preserves_order():
+    """Reports line up with submissions even when later submissions finish first."""
+    rubric = Rubric([Criterion(weight=1.0, requirement="Submission is even")])
+    submissions = [f"Submission {i}" for i in range(10)]
+
+    async def generate_fn(system_prompt: str, user_prompt: str) -> OneShotOutput:
+        number = next(i for i, text in enumerate(submissions) if f"\n{text}\n" in user_prompt)
+        await asyncio.sleep((len(submissions) - number) * 0.002)
+        if number % 2 == 0:
+            return OneShotOutput(criteria_evaluations=[CriterionEvaluation.met(1, "Even")])
+        return OneShotOutput(criteria_evaluations=[CriterionEvaluation.unmet(1, "Odd")])
+
+    grader = PerCriterionOneShotGrader(generate_fn=generate_fn)
+    reports = await rubric.grade_many(submissions, autograder=grader)
+
+    assert [report.score for report in reports] == [1.0, 0.0] * 5
+
+
+@pytest.mark.asyncio
+async def test_grade_many_parallel_faster_than_serial(sample_rubric, one_shot_generate_fn):
+    latency = 0.05
+
+    async def slow_generate_fn(system_prompt: str, user_prompt: str) -> OneShotOutput:
+        await asyncio.sleep(latency)
+        return await one_shot_generate_fn(system_prompt, user_prompt)
+
+    grader = PerCriterionOneShotGrader(generate_fn=slow_generate_fn)
+    start = time.monotonic()
+    reports = await sample_rubric.grade_many(["Test"] * 10, autograder=grader)
+    elapsed = time.monotonic() - start
+
+    assert len(reports) == 10
+    assert elapsed < 2 * latency
+
+
+@pytest.mark.asyncio
+async def test_grade_many_rejects_mismatched_queries(sample_rubric, one_shot_generate_fn):
+    grader = PerCriterionOneShotGrader(generate_fn=one_shot_generate_fn)
+    with pytest.raises(ValueError, match="Expected 2 queries"):
+        await sample_rubric.grade_many(["a", "b"], autograder=grader, queries=["q"])